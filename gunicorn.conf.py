@@ -0,0 +1,34 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Serve with: gunicorn main:app
+load_dotenv()
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+
+# Handlers mostly wait on MongoDB and SendGrid, so one gevent worker per core multiplexes many requests.
+# Each worker opens up to MONGO_MAX_POOL_SIZE (defaulting to GUNICORN_WORKER_CONNECTIONS) app connections plus
+# 5 rate limiter connections, so keep the pool in step with worker_connections when overriding either one.
+worker_class = 'gevent'
+workers = int(os.environ.get('GUNICORN_WORKERS') or os.cpu_count() or 1)
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS') or 50)
+timeout = 60
+
+# Each worker builds its own app (and MongoClient) after the fork
+preload_app = False
+
+
+def on_starting(server):
+    """
+    Refuse to start several workers with per-process rate limit counters.
+
+    :param server: The gunicorn arbiter
+    :type server: gunicorn.arbiter.Arbiter
+    """
+    storage_uri = os.environ.get('RATELIMIT_STORAGE_URI') or os.environ.get('MONGO_URI') or 'memory://'
+    if server.cfg.workers > 1 and storage_uri.startswith('memory://'):
+        server.log.error(
+            "Rate limits would drift across %s workers with memory:// storage. "
+            "Set MONGO_URI or RATELIMIT_STORAGE_URI, or run a single worker.", server.cfg.workers
+        )
+        sys.exit(1)
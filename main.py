@@ -1,4 +1,5 @@
 import os
+import atexit
 import shortuuid
 from flask_cors import CORS
 from jinja2 import Template
@@ -8,15 +9,10 @@ from flask_limiter import Limiter
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
 from flask_limiter.util import get_remote_address
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Blueprint, current_app, request, jsonify, render_template
 
 load_dotenv()
-app = Flask(__name__, template_folder="templates")
-CORS(app)
-
-client = MongoClient(os.environ.get('MONGO_URI'))
-users_collection = client.users["users"]
-news_collection = client.users["news"]
+api = Blueprint('api', __name__)
 
 CATEGORY_MAPPING = {
     "realestate": "Real Estate",
@@ -24,28 +20,28 @@ CATEGORY_MAPPING = {
     "us": "U.S."
 }
 
-limiter = Limiter(
-    get_remote_address,
-    app=app,
-    default_limits=["5 per minute"],
-    storage_uri="memory://",
-)
-
-with open('templates/email_templates/registration_email.html', 'r') as file:
-    registration_email_template = file.read()
-with open('templates/email_templates/validate_email.html', 'r') as file:
-    validate_user_email_template = file.read()
-with open('templates/email_templates/updated_preferences_email.html', 'r') as file:
-    updated_preferences_email_template = file.read()
-with open('templates/email_templates/user_unsubscribe_email.html', 'r') as file:
-    user_unsubscribe_email_template = file.read()
-with open('templates/email_templates/feedback_email.txt', 'r') as file:
-    user_feedback_email_template = file.read()
-with open('templates/email_templates/article_template.txt', 'r') as file:
-    article_template = file.read()
-
-
-@app.route("/register_user", methods=["POST"])
+EMAIL_TEMPLATES = [
+    'registration_email.html',
+    'validate_email.html',
+    'updated_preferences_email.html',
+    'user_unsubscribe_email.html',
+    'feedback_email.txt',
+    'article_template.txt',
+]
+
+# Each request makes a single counter update, so the limiter's own client gets a small pool and fails fast
+# into the in-memory fallback instead of stalling requests
+RATELIMIT_MONGO_OPTIONS = {
+    'maxPoolSize': 5,
+    'serverSelectionTimeoutMS': 2000,
+    'waitQueueTimeoutMS': 1000,
+    'connect': False,
+}
+
+limiter = Limiter(get_remote_address, default_limits=["5 per minute"])
+
+
+@api.route("/register_user", methods=["POST"])
 def register_user():
     """
     Registers a new user based on POST data.
@@ -66,7 +62,7 @@ def register_user():
         if not email or not first_name or not last_name or not categories:
             return jsonify({"error": "Missing required fields"}), 400
 
-        user = users_collection.find_one({'email': email})
+        user = get_users_collection().find_one({'email': email})
 
         if not user or user['validated'] == 'false':
             uuid = shortuuid.uuid()
@@ -80,8 +76,8 @@ def register_user():
                     'validated': 'false'
                 }
             }
-            users_collection.update_one({'email': email}, user_update, upsert=True)
-            validate_user_email_content = Template(validate_user_email_template).render({
+            get_users_collection().update_one({'email': email}, user_update, upsert=True)
+            validate_user_email_content = Template(get_email_template('validate_email.html')).render({
                 'first_name': first_name,
                 'last_name': last_name,
                 'uuid': uuid
@@ -95,7 +91,7 @@ def register_user():
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/update_user_preferences", methods=["POST"])
+@api.route("/update_user_preferences", methods=["POST"])
 def update_existing_user():
     """
     Update existing user preferences based on POST data.
@@ -116,7 +112,7 @@ def update_existing_user():
         if not uuid or not first_name or not last_name or not new_categories:
             return jsonify({"error": "Missing required fields"}), 400
 
-        user = users_collection.find_one({'uuid': uuid})
+        user = get_users_collection().find_one({'uuid': uuid})
 
         if user:
             if user['validated'] == 'true':
@@ -132,15 +128,16 @@ def update_existing_user():
                 for category in new_categories:
                     formatted_category = CATEGORY_MAPPING.get(category, category)
                     content.append(f"<h2>{formatted_category.title()}</h2>")
-                    for article in list(news_collection.find({"category": category}))[3:]:
-                        content.append(Template(article_template).render({
+                    for article in list(get_news_collection().find({"category": category}))[3:]:
+                        content.append(Template(get_email_template('article_template.txt')).render({
                             'image': article["image"],
                             'url': article["url"],
                             'title': article["title"],
                             'content': article["content"],
                         }))
 
-                users_collection.update_one({'uuid': uuid}, user_update, upsert=True)
+                get_users_collection().update_one({'uuid': uuid}, user_update, upsert=True)
+                updated_preferences_email_template = get_email_template('updated_preferences_email.html')
                 updated_preferences_email_content = Template(updated_preferences_email_template).render({
                     'first_name': first_name,
                     'last_name': last_name,
@@ -159,7 +156,7 @@ def update_existing_user():
         return jsonify({"error": str(e)}), 500
 
 
-@app.route('/<uuid>/get_user_info', methods=['GET'])
+@api.route('/<uuid>/get_user_info', methods=['GET'])
 def get_user_info(uuid):
     """
     Get user information, including first name, last name, and categories, for a validated user.
@@ -170,7 +167,7 @@ def get_user_info(uuid):
     :rtype: dict
     """
     try:
-        user = users_collection.find_one({'uuid': uuid})
+        user = get_users_collection().find_one({'uuid': uuid})
 
         if user:
             user_info = {
@@ -186,7 +183,7 @@ def get_user_info(uuid):
         return jsonify({"error": str(e)}), 500
 
 
-@app.route('/<uuid>/validate', methods=['GET'])
+@api.route('/<uuid>/validate', methods=['GET'])
 def validate_user(uuid):
     """
     Validate a user's email address.
@@ -197,26 +194,26 @@ def validate_user(uuid):
     :rtype: str
     """
     try:
-        user = users_collection.find_one({'uuid': uuid})
+        user = get_users_collection().find_one({'uuid': uuid})
 
         if user:
             if user['validated'] == 'false':
                 user_update = {'$set': {'validated': 'true'}}
-                users_collection.update_one({'uuid': uuid}, user_update, upsert=True)
+                get_users_collection().update_one({'uuid': uuid}, user_update, upsert=True)
 
                 content = []
                 for category in user['categories']:
                     formatted_category = CATEGORY_MAPPING.get(category, category)
                     content.append(f"<h2>{formatted_category.title()}</h2>")
-                    for article in list(news_collection.find({"category": category}))[3:]:
-                        content.append(Template(article_template).render({
+                    for article in list(get_news_collection().find({"category": category}))[3:]:
+                        content.append(Template(get_email_template('article_template.txt')).render({
                             'image': article["image"],
                             'url': article["url"],
                             'title': article["title"],
                             'content': article["content"],
                         }))
 
-                registration_email_content = Template(registration_email_template).render({
+                registration_email_content = Template(get_email_template('registration_email.html')).render({
                     'first_name': user['first_name'],
                     'last_name': user['last_name'],
                     'content': ''.join(content),
@@ -237,7 +234,7 @@ def validate_user(uuid):
         return jsonify({"error": str(e)}), 500
 
 
-@app.route('/unsubscribe', methods=['POST'])
+@api.route('/unsubscribe', methods=['POST'])
 def unsubscribe():
     """
     Unsubscribe a user from email notifications and sends the user's feedback to the developer.
@@ -250,11 +247,11 @@ def unsubscribe():
         if not data:
             return jsonify({"error": "Invalid JSON data"}), 400
 
-        user = users_collection.find_one_and_delete({'uuid': data['uuid']})
+        user = get_users_collection().find_one_and_delete({'uuid': data['uuid']})
 
         if user:
             first_name = user['first_name']
-            unsubscription_email_content = Template(user_unsubscribe_email_template).render({
+            unsubscription_email_content = Template(get_email_template('user_unsubscribe_email.html')).render({
                 'first_name': first_name,
                 'last_name': user['last_name'],
             })
@@ -262,7 +259,7 @@ def unsubscribe():
                 'Your Daily Rundown - Unsubscription Confirmation', user['email'], unsubscription_email_content
             )
             if data["feedback"]:
-                user_feedback_email_content = user_feedback_email_template.format(
+                user_feedback_email_content = get_email_template('feedback_email.txt').format(
                     user['first_name'], user['last_name'], user['email'], data['feedback']
                 )
                 send_email('YourDailyRundown - Feedback', os.environ.get('DEV_EMAIL'), user_feedback_email_content)
@@ -273,11 +270,89 @@ def unsubscribe():
         return jsonify({"error": str(e)}), 500
 
 
-@app.errorhandler(429)
+@api.app_errorhandler(429)
 def ratelimit_handler(e):
     return jsonify({"error": str(e)}), 429
 
 
+def create_app():
+    """
+    Create the Flask application, its MongoDB client and its rate limit storage.
+
+    Called once per worker process, so the MongoClient (and its connection pool) is never shared across a fork.
+
+    :returns: The configured Flask application
+    :rtype: Flask
+    """
+    app = Flask(__name__, template_folder="templates")
+    CORS(app)
+
+    # Sized to match the gevent worker's GUNICORN_WORKER_CONNECTIONS so every greenlet can get a connection
+    pool_options = {
+        'maxPoolSize': int(
+            os.environ.get('MONGO_MAX_POOL_SIZE') or os.environ.get('GUNICORN_WORKER_CONNECTIONS') or 50
+        ),
+        # Close sockets left idle after a burst instead of holding the full pool open in every worker
+        'maxIdleTimeMS': int(os.environ.get('MONGO_MAX_IDLE_TIME_MS') or 60000),
+        'waitQueueTimeoutMS': int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS') or 5000),
+    }
+    client = MongoClient(os.environ.get('MONGO_URI'), connect=False, **pool_options)
+    atexit.register(client.close)
+    app.extensions['mongo_client'] = client
+    app.extensions['users_collection'] = client.users["users"]
+    app.extensions['news_collection'] = client.users["news"]
+
+    email_templates = {}
+    for template_name in EMAIL_TEMPLATES:
+        with open(os.path.join(app.root_path, 'templates', 'email_templates', template_name), 'r') as file:
+            email_templates[template_name] = file.read()
+    app.extensions['email_templates'] = email_templates
+
+    # Counters kept in MongoDB are shared by every worker; memory:// is only safe for a single process
+    app.config['RATELIMIT_STORAGE_URI'] = (
+        os.environ.get('RATELIMIT_STORAGE_URI') or os.environ.get('MONGO_URI') or 'memory://'
+    )
+    if app.config['RATELIMIT_STORAGE_URI'].startswith('mongodb'):
+        app.config['RATELIMIT_STORAGE_OPTIONS'] = RATELIMIT_MONGO_OPTIONS
+    # Keep serving with per-process counters while the shared storage is unreachable
+    app.config['RATELIMIT_IN_MEMORY_FALLBACK_ENABLED'] = True
+    limiter.init_app(app)
+    app.register_blueprint(api)
+    return app
+
+
+def get_users_collection():
+    """
+    Get the users collection belonging to the current application.
+
+    :returns: The MongoDB users collection
+    :rtype: pymongo.collection.Collection
+    """
+    return current_app.extensions['users_collection']
+
+
+def get_news_collection():
+    """
+    Get the news collection belonging to the current application.
+
+    :returns: The MongoDB news collection
+    :rtype: pymongo.collection.Collection
+    """
+    return current_app.extensions['news_collection']
+
+
+def get_email_template(template_name):
+    """
+    Get the raw contents of an email template loaded by the current application.
+
+    :param template_name: File name of the template in templates/email_templates
+    :type template_name: str
+    :returns: The template contents
+    :rtype: str
+    """
+    return current_app.extensions['email_templates'][template_name]
+
+
 def send_email(subject, recipient, email_content):
     """
     Send an email using the SendGrid API.
@@ -319,6 +394,8 @@ def format_categories(categories):
         return ""
 
 
+app = create_app()
+
 if __name__ == "__main__":
     """
     Runs the backend server.